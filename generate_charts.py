@@ -4,11 +4,16 @@ Business Analytics Dashboard Generator for Mojo.az User Data
 Generates business-focused visualizations to support strategic decision-making
 """
 
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render straight to PNG, no GUI backend
 import matplotlib.pyplot as plt
 import seaborn as sns
-from datetime import datetime
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,6 +21,7 @@ warnings.filterwarnings('ignore')
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 plt.rcParams['font.size'] = 10
+plt.rcParams['figure.constrained_layout.use'] = True
 
 # Azerbaijani month mapping
 AZ_MONTHS = {
@@ -23,55 +29,82 @@ AZ_MONTHS = {
     'iyul': 7, 'avqust': 8, 'sentyabr': 9, 'oktyabr': 10, 'noyabr': 11, 'dekabr': 12
 }
 
-def parse_azerbaijani_date(date_str, scrape_date):
-    """Parse Azerbaijani date strings to datetime objects"""
-    if pd.isna(date_str):
-        return None
+# Regular dates: "15 dekabr 2019"
+AZ_DATE_PATTERN = re.compile(r'(\d+)\s+(\w+)\s+(\d{4})')
+
+def parse_azerbaijani_dates(date_series, scrape_days):
+    """Parse a column of Azerbaijani date strings to datetimes
+
+    scrape_days holds the scrape timestamps already normalized to midnight.
+    """
+    dates = date_series.astype('string[pyarrow]').str.strip()
+
+    # Regular dates: "15 dekabr 2019"
+    parts = dates.str.extract(AZ_DATE_PATTERN)
+    parsed = pd.to_datetime(
+        pd.DataFrame({
+            'year': pd.to_numeric(parts[2], errors='coerce'),
+            'month': parts[1].str.lower().map(AZ_MONTHS),
+            'day': pd.to_numeric(parts[0], errors='coerce'),
+        }, dtype='float'),
+        errors='coerce'
+    )
+
+    # Relative dates: "Bugün" (Today) and "Dünən" (Yesterday)
+    parsed = parsed.mask(dates.str.startswith('Bugün').fillna(False), scrape_days)
+    parsed = parsed.mask(dates.str.startswith('Dünən').fillna(False), scrape_days - pd.Timedelta(days=1))
 
-    date_str = str(date_str).strip()
+    return parsed
 
-    # Handle "Bugün" (Today)
-    if date_str.startswith('Bugün'):
-        return scrape_date.replace(hour=0, minute=0, second=0, microsecond=0)
+def days_between(later, earlier):
+    """Whole days from earlier to later, same as (later - earlier).dt.days"""
+    delta = later.to_numpy() - earlier.to_numpy()
+    missing = np.isnat(delta)
 
-    # Handle "Dünən" (Yesterday)
-    if date_str.startswith('Dünən'):
-        return scrape_date.replace(hour=0, minute=0, second=0, microsecond=0) - pd.Timedelta(days=1)
+    # Floor-divide the raw timedelta64 values in one numpy pass
+    with np.errstate(invalid='ignore'):
+        days = delta // np.timedelta64(1, 'D')
 
-    # Handle regular dates: "15 dekabr 2019"
-    pattern = r'(\d+)\s+(\w+)\s+(\d{4})'
-    match = re.search(pattern, date_str)
-    if match:
-        day, month_name, year = match.groups()
-        month = AZ_MONTHS.get(month_name.lower())
-        if month:
-            try:
-                return datetime(int(year), month, int(day))
-            except:
-                return None
+    # NaT divides to 0, so put the gaps back as NaN
+    if missing.any():
+        days = np.where(missing, np.nan, days)
 
-    return None
+    return pd.Series(days, index=later.index)
 
 def load_and_prepare_data():
     """Load and prepare user data for analysis"""
+    csv_path = Path('mojo_users.csv')
+    cache_path = Path('mojo_users.parquet')
+
+    # Reuse the prepared data if neither the CSV nor this script changed since it was cached
+    source_mtime = max(csv_path.stat().st_mtime, Path(__file__).stat().st_mtime)
+    if cache_path.exists() and cache_path.stat().st_mtime >= source_mtime:
+        print("Loading prepared dataset from cache...")
+        try:
+            df = pd.read_parquet(cache_path, engine='pyarrow')
+            print(f"Loaded {len(df):,} valid user records\n")
+            return df
+        except (OSError, ValueError) as e:
+            # Unreadable cache (e.g. left truncated by an older version); rebuild it from the CSV
+            print(f"Cache unreadable ({e}), rebuilding from CSV")
+
     print("Loading dataset...")
-    df = pd.read_csv('mojo_users.csv')
+    df = pd.read_csv(csv_path, engine='pyarrow')
 
     print(f"Dataset size: {len(df):,} users")
 
+    # Shrink integer columns to the smallest type that holds their values
+    for column in ['user_id', 'listing_count']:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+
     # Parse scraped_at as reference date
     df['scraped_at'] = pd.to_datetime(df['scraped_at'])
 
     # Parse dates
     print("Processing dates...")
-    df['registration_date_parsed'] = df.apply(
-        lambda row: parse_azerbaijani_date(row['registration_date'], row['scraped_at']),
-        axis=1
-    )
-    df['last_seen_date_parsed'] = df.apply(
-        lambda row: parse_azerbaijani_date(row['last_seen_date'], row['scraped_at']),
-        axis=1
-    )
+    scrape_days = df['scraped_at'].dt.normalize()
+    df['registration_date_parsed'] = parse_azerbaijani_dates(df['registration_date'], scrape_days)
+    df['last_seen_date_parsed'] = parse_azerbaijani_dates(df['last_seen_date'], scrape_days)
 
     # Remove records with invalid dates
     df = df.dropna(subset=['registration_date_parsed'])
@@ -79,11 +112,13 @@ def load_and_prepare_data():
     # Extract temporal features
     df['registration_year'] = df['registration_date_parsed'].dt.year
     df['registration_month'] = df['registration_date_parsed'].dt.to_period('M')
-    df['registration_quarter'] = df['registration_date_parsed'].dt.to_period('Q')
+    df['registration_quarter'] = df['registration_month'].dt.asfreq('Q')
 
     # Calculate user lifecycle metrics
-    df['days_since_registration'] = (df['scraped_at'] - df['registration_date_parsed']).dt.days
-    df['days_since_last_seen'] = (df['scraped_at'] - df['last_seen_date_parsed']).dt.days
+    df['days_since_registration'] = days_between(df['scraped_at'], df['registration_date_parsed'])
+    df['days_since_last_seen'] = days_between(df['scraped_at'], df['last_seen_date_parsed'])
+    for column in ['days_since_registration', 'days_since_last_seen']:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
 
     # User activity segmentation
     df['is_active_user'] = df['days_since_last_seen'] <= 30
@@ -97,6 +132,11 @@ def load_and_prepare_data():
                 'Moderate (Last 90 days)', 'Low Activity (Last Year)', 'Inactive']
     )
 
+    # Write the cache aside and swap it in, so an interrupted write never leaves a truncated cache
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    df.to_parquet(tmp_path, index=False, engine='pyarrow')
+    os.replace(tmp_path, cache_path)
+
     print(f"Processed {len(df):,} valid user records\n")
     return df
 
@@ -105,7 +145,7 @@ def generate_user_growth_chart(df):
     print("Generating Chart 1: User Growth Trends...")
 
     # Monthly registrations
-    monthly_reg = df.groupby('registration_month').size().reset_index(name='new_users')
+    monthly_reg = df.groupby('registration_month', sort=False).size().sort_index().reset_index(name='new_users')
     monthly_reg['cumulative_users'] = monthly_reg['new_users'].cumsum()
     monthly_reg['registration_month'] = monthly_reg['registration_month'].astype(str)
 
@@ -131,19 +171,16 @@ def generate_user_growth_chart(df):
     ax2.legend(loc='upper right', fontsize=10)
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig('charts/1_user_growth_trends.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig('charts/1_user_growth_trends.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Saved: charts/1_user_growth_trends.png")
 
 def generate_quarterly_growth_chart(df):
     """Chart 2: Quarterly Growth Comparison"""
     print("Generating Chart 2: Quarterly Performance...")
 
-    quarterly = df.groupby('registration_quarter').size().reset_index(name='users')
+    quarterly = df.groupby('registration_quarter', sort=False).size().sort_index().reset_index(name='users')
     quarterly['quarter'] = quarterly['registration_quarter'].astype(str)
-    quarterly['year'] = quarterly['registration_quarter'].apply(lambda x: str(x).split('Q')[0])
-    quarterly['q'] = quarterly['registration_quarter'].apply(lambda x: 'Q' + str(x).split('Q')[1])
 
     fig, ax = plt.subplots(figsize=(14, 7))
 
@@ -163,20 +200,20 @@ def generate_quarterly_growth_chart(df):
     ax.set_xticklabels(quarterly['quarter'], rotation=45, ha='right')
 
     # Add value labels on bars
-    for i, (idx, row) in enumerate(quarterly.iterrows()):
-        ax.text(i, row['users'] + 50, f"{row['users']:,}", ha='center', va='bottom', fontsize=9)
+    labels = [f'{users:,}' for users in quarterly['users'].to_numpy()]
+    ax.bar_label(bars, labels=labels, padding=3, fontsize=9)
 
     ax.grid(True, axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('charts/2_quarterly_performance.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig('charts/2_quarterly_performance.png', dpi=150)
+    plt.close(fig)
     print("  ✓ Saved: charts/2_quarterly_performance.png")
 
 def generate_user_engagement_chart(df):
     """Chart 3: User Engagement Distribution"""
     print("Generating Chart 3: User Engagement Analysis...")
 
-    segment_counts = df['user_segment'].value_counts().sort_index()
+    # Categorical counts come back in tier order, no sort needed
+    segment_counts = df['user_segment'].value_counts(sort=False)
 
     fig, ax = plt.subplots(figsize=(12, 7))
 
@@ -189,16 +226,14 @@ def generate_user_engagement_chart(df):
     ax.set_title('User Engagement Distribution by Activity Level', fontsize=14, fontweight='bold', pad=20)
 
     # Add percentage labels
-    total = segment_counts.sum()
-    for i, (count, bar) in enumerate(zip(segment_counts.values, bars)):
-        percentage = (count / total) * 100
-        ax.text(count + 100, i, f'{count:,} ({percentage:.1f}%)',
-                va='center', fontsize=10, fontweight='bold')
+    counts = segment_counts.to_numpy()
+    percentages = counts / counts.sum() * 100
+    labels = [f'{count:,} ({percentage:.1f}%)' for count, percentage in zip(counts, percentages)]
+    ax.bar_label(bars, labels=labels, padding=3, fontsize=10, fontweight='bold')
 
     ax.grid(True, axis='x', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('charts/3_user_engagement_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig('charts/3_user_engagement_distribution.png', dpi=150)
+    plt.close(fig)
     print("  ✓ Saved: charts/3_user_engagement_distribution.png")
 
 def generate_listing_activity_chart(df):
@@ -206,14 +241,15 @@ def generate_listing_activity_chart(df):
     print("Generating Chart 4: Listing Activity Patterns...")
 
     # Categorize by listing count
-    df['listing_category'] = pd.cut(
+    listing_category = pd.cut(
         df['listing_count'],
         bins=[-0.1, 0, 1, 5, 10, 50, float('inf')],
         labels=['No Listings', '1 Listing', '2-5 Listings',
                 '6-10 Listings', '11-50 Listings', '50+ Listings']
     )
 
-    listing_dist = df['listing_category'].value_counts().sort_index()
+    # Categorical counts come back in bin order, no sort needed
+    listing_dist = listing_category.value_counts(sort=False)
 
     fig, ax = plt.subplots(figsize=(12, 7))
 
@@ -226,30 +262,26 @@ def generate_listing_activity_chart(df):
     ax.set_title('User Distribution by Listing Activity', fontsize=14, fontweight='bold', pad=20)
 
     # Add value labels
-    total = listing_dist.sum()
-    for i, (count, bar) in enumerate(zip(listing_dist.values, bars)):
-        percentage = (count / total) * 100
-        ax.text(i, count + 50, f'{count:,}\n({percentage:.1f}%)',
-                ha='center', va='bottom', fontsize=9, fontweight='bold')
+    counts = listing_dist.to_numpy()
+    percentages = counts / counts.sum() * 100
+    labels = [f'{count:,}\n({percentage:.1f}%)' for count, percentage in zip(counts, percentages)]
+    ax.bar_label(bars, labels=labels, padding=3, fontsize=9, fontweight='bold')
 
     ax.grid(True, axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('charts/4_listing_activity_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig('charts/4_listing_activity_distribution.png', dpi=150)
+    plt.close(fig)
     print("  ✓ Saved: charts/4_listing_activity_distribution.png")
 
 def generate_engagement_vs_listings_chart(df):
     """Chart 5: Relationship Between Engagement and Listings"""
     print("Generating Chart 5: Engagement vs Listing Analysis...")
 
-    # Create cross-tabulation
-    engagement_listing = pd.crosstab(
-        df['user_segment'],
-        df['has_listings'],
-        normalize='index'
-    ) * 100
-
-    engagement_listing.columns = ['No Listings', 'Has Listings']
+    # Share of each segment with listings: the mean of a boolean column
+    has_listings_pct = df.groupby('user_segment', observed=True)['has_listings'].mean() * 100
+    engagement_listing = pd.DataFrame({
+        'No Listings': 100 - has_listings_pct,
+        'Has Listings': has_listings_pct
+    })
 
     fig, ax = plt.subplots(figsize=(12, 7))
 
@@ -275,19 +307,18 @@ def generate_engagement_vs_listings_chart(df):
                    ha='center', va='center', fontsize=10, color='white', fontweight='bold')
 
     ax.grid(True, axis='x', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('charts/5_engagement_vs_listings.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig('charts/5_engagement_vs_listings.png', dpi=150)
+    plt.close(fig)
     print("  ✓ Saved: charts/5_engagement_vs_listings.png")
 
 def generate_retention_cohort_chart(df):
     """Chart 6: User Retention Analysis by Registration Year"""
     print("Generating Chart 6: Retention Analysis...")
 
-    retention = df.groupby('registration_year').agg({
+    retention = df.groupby('registration_year', sort=False).agg({
         'user_id': 'count',
         'is_active_user': 'sum'
-    }).reset_index()
+    }).sort_index().reset_index()
 
     retention.columns = ['Year', 'Total Users', 'Active Users']
     retention['Inactive Users'] = retention['Total Users'] - retention['Active Users']
@@ -318,40 +349,41 @@ def generate_retention_cohort_chart(df):
     ax2.legend(loc='upper right', fontsize=10)
 
     # Add value labels
-    for i, row in retention.iterrows():
-        ax.text(i, row['Total Users'] + 50, f"{row['Retention Rate (%)']}%",
-                ha='center', va='bottom', fontsize=9, fontweight='bold')
+    for i, (total, rate) in enumerate(zip(retention['Total Users'].to_numpy(),
+                                          retention['Retention Rate (%)'].to_numpy())):
+        ax.text(i, total + 50, f"{rate}%", ha='center', va='bottom', fontsize=9, fontweight='bold')
 
     ax.grid(True, axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('charts/6_retention_by_cohort.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig('charts/6_retention_by_cohort.png', dpi=150)
+    plt.close(fig)
     print("  ✓ Saved: charts/6_retention_by_cohort.png")
 
 def generate_power_users_chart(df):
     """Chart 7: Power User Analysis"""
     print("Generating Chart 7: Power User Analysis...")
 
-    # Top listing creators
-    power_users = df[df['listing_count'] > 0].nlargest(20, 'listing_count')
+    # Top listing creators, selected on the column alone to avoid copying the frame
+    top_listings = df['listing_count'].nlargest(20)
+    top_listings = top_listings[top_listings > 0]
+    top_counts = top_listings.to_numpy()
+    top_ids = df.loc[top_listings.index, 'user_id'].to_numpy()
 
     fig, ax = plt.subplots(figsize=(14, 8))
 
-    colors = ['#e74c3c' if i < 5 else '#3498db' for i in range(len(power_users))]
-    bars = ax.barh(range(len(power_users)), power_users['listing_count'].values,
-                   color=colors, alpha=0.85)
+    colors = ['#e74c3c' if i < 5 else '#3498db' for i in range(len(top_counts))]
+    bars = ax.barh(range(len(top_counts)), top_counts, color=colors, alpha=0.85)
 
     # Create labels (user_id to maintain privacy)
-    labels = [f"User {row['user_id']}" for _, row in power_users.iterrows()]
+    labels = [f"User {user_id}" for user_id in top_ids]
 
-    ax.set_yticks(range(len(power_users)))
+    ax.set_yticks(range(len(top_counts)))
     ax.set_yticklabels(labels, fontsize=9)
     ax.set_xlabel('Number of Listings', fontsize=12, fontweight='bold')
     ax.set_title('Top 20 Content Creators by Listing Volume', fontsize=14, fontweight='bold', pad=20)
 
     # Add value labels
-    for i, count in enumerate(power_users['listing_count'].values):
-        ax.text(count + 1, i, f'{count:,}', va='center', fontsize=9)
+    labels = [f'{count:,}' for count in top_counts]
+    ax.bar_label(bars, labels=labels, padding=3, fontsize=9)
 
     # Add legend
     from matplotlib.patches import Patch
@@ -362,38 +394,58 @@ def generate_power_users_chart(df):
     ax.legend(handles=legend_elements, loc='lower right', fontsize=10)
 
     ax.grid(True, axis='x', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('charts/7_power_users_analysis.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig('charts/7_power_users_analysis.png', dpi=150)
+    plt.close(fig)
     print("  ✓ Saved: charts/7_power_users_analysis.png")
 
 def generate_activity_timeline_chart(df):
     """Chart 8: Monthly Active Users Timeline"""
     print("Generating Chart 8: Active User Timeline...")
 
-    # Calculate monthly metrics
-    monthly_data = []
-
-    for month in df['registration_month'].unique():
-        month_date = pd.Period(month).to_timestamp()
-
-        # Users registered by this month
-        registered = df[df['registration_date_parsed'] <= month_date]
-
-        # Active users in this month (last seen within 30 days of month end)
-        month_end = month_date + pd.offsets.MonthEnd(0)
-        active = registered[
-            (registered['last_seen_date_parsed'] >= month_end - pd.Timedelta(days=30)) &
-            (registered['last_seen_date_parsed'] <= month_end)
-        ]
-
-        monthly_data.append({
-            'month': str(month),
-            'total_users': len(registered),
-            'active_users': len(active)
-        })
-
-    timeline_df = pd.DataFrame(monthly_data)
+    # Month axis: every month with at least one registration
+    months = pd.PeriodIndex(df['registration_month'].unique()).sort_values()
+    month_starts = months.to_timestamp()
+    month_ends = month_starts + pd.offsets.MonthEnd(0)
+    window_starts = month_ends - pd.Timedelta(days=30)
+
+    # Users registered by each month start
+    registered = np.sort(df['registration_date_parsed'].to_numpy())
+    total_users = np.searchsorted(registered, month_starts.to_numpy(), side='right')
+
+    # Users last seen within 30 days of each month end...
+    last_seen = np.sort(df['last_seen_date_parsed'].dropna().to_numpy())
+    seen_in_window = (np.searchsorted(last_seen, month_ends.to_numpy(), side='right') -
+                      np.searchsorted(last_seen, window_starts.to_numpy(), side='left'))
+
+    # ...excluding those who only registered after that month started
+    reg_month_start = df['registration_month'].dt.to_timestamp()
+    reg_month_end = reg_month_start + pd.offsets.MonthEnd(0)
+    registered_mid_month = (
+        (df['registration_date_parsed'] > reg_month_start) &
+        (df['last_seen_date_parsed'] >= reg_month_end - pd.Timedelta(days=30)) &
+        (df['last_seen_date_parsed'] <= reg_month_end)
+    )
+    not_yet_registered = registered_mid_month.groupby(df['registration_month'], sort=False).sum().sort_index().to_numpy()
+
+    # Users last seen before their registration month (e.g. "Bugün"/"Dünən" normalized against
+    # a literal registration date) can fall in an earlier month's window too; they are rare,
+    # so check them against every earlier month directly
+    seen_before_registration = df['last_seen_date_parsed'] < reg_month_start
+    if seen_before_registration.any():
+        early_seen = df.loc[seen_before_registration, 'last_seen_date_parsed'].to_numpy()
+        early_reg_month = reg_month_start[seen_before_registration].to_numpy()
+        in_earlier_window = (
+            (month_starts.to_numpy()[:, None] < early_reg_month) &
+            (early_seen >= window_starts.to_numpy()[:, None]) &
+            (early_seen <= month_ends.to_numpy()[:, None])
+        )
+        not_yet_registered = not_yet_registered + in_earlier_window.sum(axis=1)
+
+    timeline_df = pd.DataFrame({
+        'month': months.astype(str),
+        'total_users': total_users,
+        'active_users': seen_in_window - not_yet_registered
+    })
 
     fig, ax = plt.subplots(figsize=(14, 7))
 
@@ -414,9 +466,8 @@ def generate_activity_timeline_chart(df):
     ax.legend(loc='upper left', fontsize=10)
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig('charts/8_activity_timeline.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig('charts/8_activity_timeline.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Saved: charts/8_activity_timeline.png")
 
 def generate_summary_statistics(df):
@@ -425,10 +476,13 @@ def generate_summary_statistics(df):
     print("KEY BUSINESS METRICS SUMMARY")
     print("="*60)
 
+    # One pass per column, reused by every metric below
     total_users = len(df)
-    active_users = df['is_active_user'].sum()
-    users_with_listings = df['has_listings'].sum()
-    total_listings = df['listing_count'].sum()
+    active_users = df['is_active_user'].to_numpy().sum()
+    listing_counts = df['listing_count'].to_numpy()
+    creator_listings = listing_counts[listing_counts > 0]
+    users_with_listings = creator_listings.size
+    total_listings = creator_listings.sum()
 
     print(f"\n📊 PLATFORM OVERVIEW")
     print(f"   Total Registered Users: {total_users:,}")
@@ -437,11 +491,11 @@ def generate_summary_statistics(df):
     print(f"   Total Listings Created: {total_listings:,}")
 
     print(f"\n📈 GROWTH METRICS")
-    yearly_growth = df.groupby('registration_year').size()
+    yearly_growth = df.groupby('registration_year', sort=False).size().sort_index()
     print(f"   Peak Registration Year: {yearly_growth.idxmax()} ({yearly_growth.max():,} users)")
 
-    recent_registrations = df[df['days_since_registration'] <= 30]
-    print(f"   New Users (Last 30 days): {len(recent_registrations):,}")
+    recent_registrations = (df['days_since_registration'].to_numpy() <= 30).sum()
+    print(f"   New Users (Last 30 days): {recent_registrations:,}")
 
     print(f"\n👥 USER ENGAGEMENT")
     engagement_dist = df['user_segment'].value_counts()
@@ -449,9 +503,9 @@ def generate_summary_statistics(df):
     print(f"   Inactive Users: {engagement_dist.get('Inactive', 0):,}")
 
     print(f"\n⭐ CONTENT CREATION")
-    avg_listings = df[df['listing_count'] > 0]['listing_count'].mean()
+    avg_listings = creator_listings.mean()
     print(f"   Average Listings per Active Creator: {avg_listings:.1f}")
-    print(f"   Top Creator Listings: {df['listing_count'].max():,}")
+    print(f"   Top Creator Listings: {np.nanmax(listing_counts):,}")
 
     retention_rate = (active_users / total_users) * 100
     print(f"\n🎯 RETENTION & HEALTH")
@@ -459,6 +513,25 @@ def generate_summary_statistics(df):
 
     print("\n" + "="*60 + "\n")
 
+def generate_all_charts(df):
+    """Render every chart, each in its own process"""
+    print("Generating business insight charts...\n")
+    chart_generators = [
+        generate_user_growth_chart,
+        generate_quarterly_growth_chart,
+        generate_user_engagement_chart,
+        generate_listing_activity_chart,
+        generate_engagement_vs_listings_chart,
+        generate_retention_cohort_chart,
+        generate_power_users_chart,
+        generate_activity_timeline_chart,
+    ]
+    max_workers = min(len(chart_generators), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(generate_chart, df) for generate_chart in chart_generators]
+        for future in futures:
+            future.result()
+
 def main():
     """Main execution function"""
     print("\n" + "="*60)
@@ -468,21 +541,23 @@ def main():
     # Load data
     df = load_and_prepare_data()
 
-    # Generate all charts
-    print("Generating business insight charts...\n")
-    generate_user_growth_chart(df)
-    generate_quarterly_growth_chart(df)
-    generate_user_engagement_chart(df)
-    generate_listing_activity_chart(df)
-    generate_engagement_vs_listings_chart(df)
-    generate_retention_cohort_chart(df)
-    generate_power_users_chart(df)
-    generate_activity_timeline_chart(df)
+    # Skip rendering when neither the data nor this script changed since the last run
+    stamp_path = Path('charts/.stamp')
+    stamp = f"{Path('mojo_users.csv').stat().st_mtime}:{Path(__file__).stat().st_mtime}:{len(df)}"
+    charts_up_to_date = stamp_path.exists() and stamp_path.read_text() == stamp
+    if charts_up_to_date:
+        print("Charts are up to date, skipping rendering\n")
+    else:
+        generate_all_charts(df)
+        stamp_path.write_text(stamp)
 
     # Print summary statistics
     generate_summary_statistics(df)
 
-    print("✅ All charts generated successfully in ./charts/ directory")
+    if charts_up_to_date:
+        print("✅ Charts in ./charts/ directory are already up to date")
+    else:
+        print("✅ All charts generated successfully in ./charts/ directory")
     print("="*60 + "\n")
 
 if __name__ == "__main__":
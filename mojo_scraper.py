@@ -4,13 +4,19 @@ Scrapes user data from mojo.az with phone validation and exports to CSV/XLSX/JSO
 """
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+from aiohttp.resolver import AsyncResolver
+import codecs
+from collections import deque
+from contextlib import asynccontextmanager
 import csv
-import json
-import pandas as pd
+import orjson
+import os
+import xlsxwriter
 from datetime import datetime
-from typing import Dict, List, Optional
+from html import unescape
+from typing import BinaryIO, Dict, List, Optional
 import re
+import time
 from pathlib import Path
 import logging
 from phone_validator import PhoneValidator
@@ -26,12 +32,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Raw-HTML patterns used by parse_user_data instead of building a DOM
+NAME_TAG_PATTERN = re.compile(
+    r'<h2\b[^>]*(?<![\w-])class\s*=\s*["\'](?:[^"\']*\s)?pb-0(?:\s[^"\']*)?["\'][^>]*>(.*?)</h2\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+USER_DIV_CLASS_PATTERN = re.compile(r'(?<![\w-])class\s*=\s*["\'](?:[^"\']*\s)?p-2(?:\s[^"\']*)?["\']', re.IGNORECASE)
+# Self-closing <div/> neither opens nor closes anything, so it is not matched
+DIV_TAG_PATTERN = re.compile(r'<(/?)div\b([^>]*)(?<!/)>', re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[^>]*>')
+SCRIPT_STYLE_PATTERN = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.DOTALL | re.IGNORECASE)
+
+# Field patterns applied to the user div text
+PHONE_PATTERN = re.compile(r'\(?\d{3}\)?\s*\d{3}[-\s]?\d{2}[-\s]?\d{2}')
+REGISTRATION_DATE_PATTERN = re.compile(r'Qeydiyyat tarixi:\s*(.+?)(?:\n|<br)', re.DOTALL)
+LAST_SEEN_DATE_PATTERN = re.compile(r'Saytda olduğu tarix:\s*(.+?)(?:\n|<br)', re.DOTALL)
+LISTING_COUNT_PATTERN = re.compile(r'Elan sayı:\s*(\d+)')
+
+# Adaptive concurrency (additive increase / multiplicative decrease) tuning
+THROTTLE_STATUSES = frozenset({429, 503})
+AIMD_WINDOW_SECONDS = 10.0
+AIMD_INTERVAL_SECONDS = 1.0
+AIMD_DECREASE_ERROR_RATE = 0.05
+AIMD_INCREASE_ERROR_RATE = 0.01
+AIMD_INCREASE_STEP = 4
+AIMD_MIN_CONCURRENCY = 20
+
 
 class MojoScraper:
     """Scrapes user data from mojo.az"""
 
     def __init__(self, start_id: int = 1, end_id: int = 47000, max_concurrent: int = 200,
-                 checkpoint_file: str = 'scraper_checkpoint.json'):
+                 checkpoint_file: str = 'scraper_checkpoint.json',
+                 results_file: str = 'scraper_results.jsonl'):
         """
         Initialize scraper
 
@@ -40,13 +73,22 @@ class MojoScraper:
             end_id: Ending user ID
             max_concurrent: Maximum concurrent requests (increased default to 200)
             checkpoint_file: File to save progress for crash recovery
+            results_file: JSON Lines file valid users are streamed to as they are scraped
         """
         self.base_url = "https://mojo.az/az/users/{}"
         self.start_id = start_id
         self.end_id = end_id
         self.max_concurrent = max_concurrent
         self.checkpoint_file = checkpoint_file
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.results_file = results_file
+        self.results_stream: Optional[BinaryIO] = None
+        # Concurrency admission: a counter guarded by a condition so the limit can change mid-run
+        self.concurrency_limit = max_concurrent
+        self.in_flight = 0
+        self.slot_available = asyncio.Condition()
+        # Rolling window of (timestamp, is_error) request outcomes feeding the AIMD controller
+        self.recent_outcomes = deque()
+        self.recent_errors = 0
         self.results: List[Dict] = []
         self.session: Optional[aiohttp.ClientSession] = None
 
@@ -61,6 +103,70 @@ class MojoScraper:
             'last_processed_id': start_id - 1
         }
 
+    @asynccontextmanager
+    async def concurrency_slot(self):
+        """Hold one of the concurrency_limit request slots for the duration of the block"""
+        async with self.slot_available:
+            await self.slot_available.wait_for(lambda: self.in_flight < self.concurrency_limit)
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with self.slot_available:
+                self.in_flight -= 1
+                self.slot_available.notify(1)
+
+    async def set_concurrency(self, limit: int):
+        """
+        Change the number of requests allowed in flight
+
+        Shrinking takes effect as running requests finish; growing wakes waiters immediately.
+
+        Args:
+            limit: New concurrency limit (at least 1)
+        """
+        async with self.slot_available:
+            self.concurrency_limit = max(1, limit)
+            self.slot_available.notify_all()
+
+    def record_outcome(self, is_error: bool):
+        """Add one request outcome to the rolling window used by adjust_concurrency"""
+        self.recent_outcomes.append((time.monotonic(), is_error))
+        self.recent_errors += is_error
+
+    async def adjust_concurrency(self):
+        """
+        Tune the concurrency limit from the recent throttle/timeout rate until cancelled
+
+        Halves the limit when more than 5% of requests in the window failed and adds a few
+        slots when fewer than 1% did, never going above max_concurrent.
+        """
+        floor = min(AIMD_MIN_CONCURRENCY, self.max_concurrent)
+        while True:
+            await asyncio.sleep(AIMD_INTERVAL_SECONDS)
+
+            cutoff = time.monotonic() - AIMD_WINDOW_SECONDS
+            while self.recent_outcomes and self.recent_outcomes[0][0] < cutoff:
+                _, is_error = self.recent_outcomes.popleft()
+                self.recent_errors -= is_error
+            if not self.recent_outcomes:
+                continue
+
+            error_rate = self.recent_errors / len(self.recent_outcomes)
+            limit = self.concurrency_limit
+            if error_rate > AIMD_DECREASE_ERROR_RATE and limit > floor:
+                new_limit = max(floor, limit // 2)
+                # Judge the reduced limit on fresh outcomes only
+                self.recent_outcomes.clear()
+                self.recent_errors = 0
+            elif error_rate < AIMD_INCREASE_ERROR_RATE and limit < self.max_concurrent:
+                new_limit = min(self.max_concurrent, limit + AIMD_INCREASE_STEP)
+            else:
+                continue
+
+            logger.info(f"Concurrency {limit} -> {new_limit} (error rate {error_rate:.1%})")
+            await self.set_concurrency(new_limit)
+
     async def create_session(self):
         """Create aiohttp session with proper headers and connection pooling"""
         headers = {
@@ -71,7 +177,10 @@ class MojoScraper:
         }
         # Reduced timeout for faster failures, increased connection limit
         timeout = aiohttp.ClientTimeout(total=10, connect=5)
-        connector = aiohttp.TCPConnector(limit=300, limit_per_host=100, ttl_dns_cache=300)
+        # aiodns-backed resolver keeps DNS lookups on the event loop instead of a thread pool
+        resolver = AsyncResolver()
+        connector = aiohttp.TCPConnector(limit=300, limit_per_host=100, ttl_dns_cache=300,
+                                         use_dns_cache=True, resolver=resolver)
         self.session = aiohttp.ClientSession(headers=headers, timeout=timeout, connector=connector)
 
     async def close_session(self):
@@ -81,14 +190,25 @@ class MojoScraper:
 
     def save_checkpoint(self):
         """Save current progress to checkpoint file"""
+        # Make the results appended so far durable before the state points past them
+        if self.results_stream and not self.results_stream.closed:
+            self.results_stream.flush()
+            os.fsync(self.results_stream.fileno())
+
+        # Results already live in results_file, so only the counters are saved here
         checkpoint_data = {
-            'results': self.results,
             'stats': self.stats,
             'timestamp': datetime.now().isoformat()
         }
-        with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"✓ Checkpoint saved: {len(self.results)} users")
+
+        # Write the small state file in one go and swap it in atomically
+        tmp_file = f'{self.checkpoint_file}.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(checkpoint_data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.checkpoint_file)
+        logger.info(f"✓ Checkpoint saved: {self.stats['valid_users']} users")
 
     def load_checkpoint(self) -> bool:
         """
@@ -98,113 +218,239 @@ class MojoScraper:
             True if checkpoint loaded, False otherwise
         """
         checkpoint_path = Path(self.checkpoint_file)
+
+        # A leftover temp file is a save that was interrupted before the swap; the real file is intact
+        stale_tmp = Path(f'{self.checkpoint_file}.tmp')
+        if stale_tmp.exists():
+            logger.warning(f"Removing incomplete checkpoint write: {stale_tmp}")
+            stale_tmp.unlink()
+
         if not checkpoint_path.exists():
             return False
 
         try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                checkpoint_data = json.load(f)
+            checkpoint_data = orjson.loads(checkpoint_path.read_bytes())
 
-            self.results = checkpoint_data.get('results', [])
             self.stats = checkpoint_data.get('stats', self.stats)
 
-            logger.info(f"✓ Checkpoint loaded: {len(self.results)} users from {checkpoint_data.get('timestamp')}")
+            # Older checkpoints embedded the results; move them to the results file
+            legacy_results = checkpoint_data.get('results')
+            if legacy_results and not Path(self.results_file).exists():
+                with open(self.results_file, 'wb') as f:
+                    for user in legacy_results:
+                        f.write(orjson.dumps(user, option=orjson.OPT_APPEND_NEWLINE))
+
+            logger.info(f"✓ Checkpoint loaded: {self.stats['valid_users']} users from {checkpoint_data.get('timestamp')}")
             logger.info(f"  Resuming from ID: {self.stats.get('last_processed_id', self.start_id)}")
             return True
         except Exception as e:
             logger.error(f"Failed to load checkpoint: {e}")
             return False
 
-    def parse_user_data(self, html: str, user_id: int) -> Optional[Dict]:
+    def load_results(self) -> List[Dict]:
+        """
+        Read scraped users back from the results file
+
+        Returns:
+            List of user data, one entry per user ID (IDs re-scraped after a resume keep the latest)
+        """
+        results_path = Path(self.results_file)
+        if not results_path.exists():
+            return []
+
+        users = {}
+        with open(results_path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    user = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A crash mid-write can leave a truncated last line
+                    logger.warning(f"Skipping unreadable line {line_number} in {self.results_file}")
+                    continue
+                users[user['user_id']] = user
+
+        return list(users.values())
+
+    @staticmethod
+    def body_encoding(charset: Optional[str]) -> str:
+        """
+        Codec to decode a response body with
+
+        Args:
+            charset: Charset label from the Content-Type header, if any
+
+        Returns:
+            The declared charset if Python knows it, otherwise 'utf-8'
+        """
+        if charset:
+            try:
+                return codecs.lookup(charset).name
+            except LookupError:
+                pass
+        return 'utf-8'
+
+    @staticmethod
+    def html_to_text(fragment: str, strip: bool = False) -> str:
+        """
+        Text content of an HTML fragment
+
+        Args:
+            fragment: Raw HTML
+            strip: Strip each text piece before joining (like get_text(strip=True))
+
+        Returns:
+            Fragment text with tags, scripts and styles removed and entities decoded
+        """
+        # Script and style bodies are not page text (get_text() skipped them too)
+        fragment = SCRIPT_STYLE_PATTERN.sub('', fragment)
+        pieces = (unescape(piece) for piece in TAG_PATTERN.split(fragment))
+        if strip:
+            return ''.join(piece.strip() for piece in pieces)
+        return ''.join(pieces)
+
+    @staticmethod
+    def find_user_div(html: str, position: int) -> Optional[str]:
+        """
+        Find the innermost <div class="p-2"> enclosing a position in raw HTML
+
+        Args:
+            html: HTML content
+            position: Offset inside the wanted div (e.g. the name tag)
+
+        Returns:
+            Inner HTML of the div or None if no such div encloses position
+        """
+        # Open divs at position, as (inner start, attributes)
+        open_divs = []
+        div_tags = DIV_TAG_PATTERN.finditer(html)
+
+        for tag in div_tags:
+            if tag.start() >= position:
+                break
+            if tag.group(1):
+                if open_divs:
+                    open_divs.pop()
+            else:
+                open_divs.append((tag.end(), tag.group(2)))
+        else:
+            tag = None
+
+        # Only the enclosing divs need a class check; stop at the innermost match
+        for depth in range(len(open_divs) - 1, -1, -1):
+            if USER_DIV_CLASS_PATTERN.search(open_divs[depth][1]):
+                break
+        else:
+            return None
+
+        start = open_divs[depth][0]
+
+        # Walk forward to the tag that closes the chosen div
+        open_count = len(open_divs)
+        while tag is not None:
+            if tag.group(1):
+                open_count -= 1
+                if open_count == depth:
+                    return html[start:tag.start()]
+            else:
+                open_count += 1
+            tag = next(div_tags, None)
+
+        return html[start:]
+
+    def parse_user_data(self, html: str, user_id: int, url: str) -> Optional[Dict]:
         """
         Parse user data from HTML
 
         Args:
             html: HTML content
             user_id: User ID
+            url: Profile URL the HTML was fetched from
 
         Returns:
             Dictionary with user data or None if invalid
         """
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
+        # Missing and suspended profiles have no name tag; skip them with a plain substring scan
+        if 'pb-0' not in html:
+            logger.debug(f"User {user_id}: No name tag found")
+            return None
 
-            # Find the h2 tag with user name first (more specific)
-            name_tag = soup.find('h2', {'class': 'pb-0'})
+        # Find the h2 tag with user name first (more specific)
+        name_match = NAME_TAG_PATTERN.search(html)
 
-            if not name_tag:
-                logger.debug(f"User {user_id}: No name tag found")
-                return None
+        if not name_match:
+            logger.debug(f"User {user_id}: No name tag found")
+            return None
 
-            # Get the name
-            name = name_tag.get_text(strip=True)
+        # Get the name
+        name = self.html_to_text(name_match.group(1), strip=True)
 
-            if not name:
-                logger.debug(f"User {user_id}: Empty name")
-                return None
+        if not name:
+            logger.debug(f"User {user_id}: Empty name")
+            return None
 
-            # Get the parent div containing user info
-            user_div = name_tag.find_parent('div', class_=lambda x: x and 'p-2' in x.split())
+        # Get the parent div containing user info
+        user_div = self.find_user_div(html, name_match.start())
 
-            if not user_div:
-                logger.debug(f"User {user_id}: No user div found")
-                return None
+        if user_div is None:
+            logger.debug(f"User {user_id}: No user div found")
+            return None
 
-            # Extract phone number - search in all text content
-            phone_raw = None
-            text_content = user_div.get_text()
+        # Extract phone number - search in all text content
+        phone_raw = None
+        text_content = self.html_to_text(user_div)
 
-            # Look for phone pattern in the text
-            phone_match = re.search(r'\(?\d{3}\)?\s*\d{3}[-\s]?\d{2}[-\s]?\d{2}', text_content)
-            if phone_match:
-                phone_raw = phone_match.group(0)
+        # Look for phone pattern in the text
+        phone_match = PHONE_PATTERN.search(text_content)
+        if phone_match:
+            phone_raw = phone_match.group(0)
 
-            # Validate phone number
-            if not phone_raw:
-                self.stats['no_phone'] += 1
-                logger.debug(f"User {user_id}: No phone found")
-                return None
+        # Validate phone number
+        if not phone_raw:
+            self.stats['no_phone'] += 1
+            logger.debug(f"User {user_id}: No phone found")
+            return None
 
-            validated_phone = PhoneValidator.validate_phone(phone_raw)
-            if not validated_phone:
-                self.stats['invalid_phone'] += 1
-                logger.debug(f"Invalid phone for user {user_id}: {phone_raw}")
-                return None
+        validated_phone = PhoneValidator.validate_phone(phone_raw)
+        if not validated_phone:
+            self.stats['invalid_phone'] += 1
+            logger.debug(f"Invalid phone for user {user_id}: {phone_raw}")
+            return None
 
-            # Extract other fields
-            registration_date = None
-            last_seen_date = None
-            listing_count = None
+        # Extract other fields
+        registration_date = None
+        last_seen_date = None
+        listing_count = None
 
-            # Extract registration date
-            reg_match = re.search(r'Qeydiyyat tarixi:\s*(.+?)(?:\n|<br)', text_content, re.DOTALL)
-            if reg_match:
-                registration_date = reg_match.group(1).strip()
+        # Extract registration date
+        reg_match = REGISTRATION_DATE_PATTERN.search(text_content)
+        if reg_match:
+            registration_date = reg_match.group(1).strip()
 
-            # Extract last seen date
-            seen_match = re.search(r'Saytda olduğu tarix:\s*(.+?)(?:\n|<br)', text_content, re.DOTALL)
-            if seen_match:
-                last_seen_date = seen_match.group(1).strip()
+        # Extract last seen date
+        seen_match = LAST_SEEN_DATE_PATTERN.search(text_content)
+        if seen_match:
+            last_seen_date = seen_match.group(1).strip()
 
-            # Extract listing count
-            listing_match = re.search(r'Elan sayı:\s*(\d+)', text_content)
-            if listing_match:
+        # Extract listing count
+        listing_match = LISTING_COUNT_PATTERN.search(text_content)
+        if listing_match:
+            try:
                 listing_count = int(listing_match.group(1))
-
-            return {
-                'user_id': user_id,
-                'name': name,
-                'phone': validated_phone,
-                'registration_date': registration_date,
-                'last_seen_date': last_seen_date,
-                'listing_count': listing_count,
-                'url': self.base_url.format(user_id),
-                'scraped_at': datetime.now().isoformat()
-            }
-
-        except Exception as e:
-            logger.error(f"Error parsing user {user_id}: {e}")
-            return None
+            except ValueError:
+                logger.debug(f"User {user_id}: Unparseable listing count {listing_match.group(1)!r}")
+
+        return {
+            'user_id': user_id,
+            'name': name,
+            'phone': validated_phone,
+            'registration_date': registration_date,
+            'last_seen_date': last_seen_date,
+            'listing_count': listing_count,
+            'url': url,
+            'scraped_at': datetime.now().isoformat()
+        }
 
     async def fetch_user(self, user_id: int) -> Optional[Dict]:
         """
@@ -216,16 +462,25 @@ class MojoScraper:
         Returns:
             User data dictionary or None
         """
-        async with self.semaphore:
+        async with self.concurrency_slot():
             url = self.base_url.format(user_id)
 
             try:
                 async with self.session.get(url) as response:
                     self.stats['total_processed'] += 1
 
+                    self.record_outcome(response.status in THROTTLE_STATUSES)
+
                     if response.status == 200:
-                        html = await response.text()
-                        user_data = self.parse_user_data(html, user_id)
+                        # Decode as the declared charset (the site serves UTF-8) without charset sniffing
+                        body = await response.read()
+                        html = body.decode(self.body_encoding(response.charset), errors='replace')
+                        try:
+                            user_data = self.parse_user_data(html, user_id, url)
+                        except Exception as e:
+                            # Unexpected page layout or parser bug; keep it visible at the default log level
+                            logger.error(f"Error parsing user {user_id}: {e}")
+                            user_data = None
 
                         if user_data:
                             self.stats['successful'] += 1
@@ -238,12 +493,18 @@ class MojoScraper:
                             self.stats['last_processed_id'] = user_id
                             return None
                     else:
+                        # Drain the small error body; closing it unread would drop the keep-alive connection
+                        await response.read()
                         self.stats['failed'] += 1
                         self.stats['last_processed_id'] = user_id
-                        logger.debug(f"✗ User {user_id}: HTTP {response.status}")
+                        if response.status == 404:
+                            logger.debug(f"✗ User {user_id}: Not found")
+                        else:
+                            logger.debug(f"✗ User {user_id}: HTTP {response.status}")
                         return None
 
             except asyncio.TimeoutError:
+                self.record_outcome(True)
                 self.stats['failed'] += 1
                 self.stats['last_processed_id'] = user_id
                 logger.debug(f"⏱ User {user_id}: Timeout")
@@ -254,6 +515,20 @@ class MojoScraper:
                 logger.debug(f"✗ User {user_id}: {e}")
                 return None
 
+    async def fetch_worker(self, id_queue: asyncio.Queue, found: Dict[int, Dict]):
+        """
+        Fetch users from the queue until it is empty
+
+        Args:
+            id_queue: Queue of user IDs still to fetch
+            found: Valid user data collected so far, keyed by user ID
+        """
+        while not id_queue.empty():
+            user_id = id_queue.get_nowait()
+            user_data = await self.fetch_user(user_id)
+            if user_data:
+                found[user_id] = user_data
+
     async def scrape_batch(self, batch_ids: List[int]) -> List[Dict]:
         """
         Scrape a batch of user IDs
@@ -264,10 +539,24 @@ class MojoScraper:
         Returns:
             List of valid user data
         """
-        tasks = [self.fetch_user(user_id) for user_id in batch_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        # Filter out None and exceptions
-        return [r for r in results if r is not None and not isinstance(r, Exception)]
+        id_queue = asyncio.Queue()
+        for user_id in batch_ids:
+            id_queue.put_nowait(user_id)
+
+        # A fixed pool of workers drains the queue, so only max_concurrent coroutines exist at once
+        found: Dict[int, Dict] = {}
+        worker_count = min(self.max_concurrent, len(batch_ids))
+        await asyncio.gather(*(self.fetch_worker(id_queue, found) for _ in range(worker_count)))
+
+        # Keep results in ID order regardless of completion order
+        valid_results = [found[user_id] for user_id in batch_ids if user_id in found]
+
+        # Stream the batch to disk so results never pile up in memory
+        for user in valid_results:
+            self.results_stream.write(orjson.dumps(user, option=orjson.OPT_APPEND_NEWLINE))
+        self.results_stream.flush()
+
+        return valid_results
 
     async def scrape_all(self, batch_size: int = 5000, save_every: int = 2000):
         """
@@ -288,7 +577,10 @@ class MojoScraper:
         else:
             actual_start = self.start_id
 
+        # Append to the results of a resumed run, otherwise start a fresh file
+        self.results_stream = open(self.results_file, 'ab' if checkpoint_loaded else 'wb')
         await self.create_session()
+        concurrency_controller = asyncio.create_task(self.adjust_concurrency())
 
         try:
             total_ids = self.end_id - actual_start + 1
@@ -306,7 +598,6 @@ class MojoScraper:
                 logger.info(f"\nProcessing batch: {batch_start} to {batch_end}")
 
                 batch_results = await self.scrape_batch(batch_ids)
-                self.results.extend(batch_results)
 
                 # Log progress
                 logger.info(f"Batch complete. Valid users in batch: {len(batch_results)}")
@@ -343,7 +634,9 @@ class MojoScraper:
             self.save_checkpoint()
             raise
         finally:
+            concurrency_controller.cancel()
             await self.close_session()
+            self.results_stream.close()
 
     def export_to_csv(self, filename: str = 'mojo_users.csv'):
         """Export results to CSV"""
@@ -368,8 +661,20 @@ class MojoScraper:
             return
 
         filepath = Path(filename)
-        df = pd.DataFrame(self.results)
-        df.to_excel(filepath, index=False, engine='openpyxl')
+        # Write row by row in constant_memory mode so each row is flushed to disk
+        # instead of building a DataFrame and an in-memory cell tree
+        fieldnames = list(self.results[0].keys())
+        # Write URLs and '='-prefixed names as plain strings, as the pandas export did
+        workbook = xlsxwriter.Workbook(str(filepath), {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'strings_to_formulas': False,
+        })
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, fieldnames)
+        for row_idx, user in enumerate(self.results, start=1):
+            worksheet.write_row(row_idx, 0, [user.get(field) for field in fieldnames])
+        workbook.close()
         logger.info(f"✓ Exported to XLSX: {filepath.absolute()}")
 
     def export_to_json(self, filename: str = 'mojo_users.json'):
@@ -379,14 +684,12 @@ class MojoScraper:
             return
 
         filepath = Path(filename)
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
-
+        filepath.write_bytes(orjson.dumps(self.results))
         logger.info(f"✓ Exported to JSON: {filepath.absolute()}")
 
     def export_all(self, base_filename: str = 'mojo_users'):
         """Export to all formats"""
+        self.results = self.load_results()
         self.export_to_csv(f'{base_filename}.csv')
         self.export_to_xlsx(f'{base_filename}.xlsx')
         self.export_to_json(f'{base_filename}.json')
@@ -432,5 +735,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run the scraper
-    asyncio.run(main())
+    # Run the scraper on the libuv-based event loop where available (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
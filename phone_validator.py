@@ -1,18 +1,30 @@
 """
 Phone number validation logic for Azerbaijan phone numbers
 """
-import re
 from typing import Optional
 
 
+class DigitTranslationTable(dict):
+    """str.translate table that keeps decimal digits and deletes everything else"""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Decide each character once, then serve it from the dict
+        mapped = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = mapped
+        return mapped
+
+
 class PhoneValidator:
     """Validates Azerbaijan phone numbers before database insertion"""
 
     # Valid prefixes for Azerbaijan phone numbers (first 2 digits)
-    VALID_PREFIXES = ['10', '50', '51', '55', '60', '70', '77', '99']
+    VALID_PREFIX_INTS = frozenset({10, 50, 51, 55, 60, 70, 77, 99})
 
     # Invalid third digits
-    INVALID_THIRD_DIGITS = ['0', '1']
+    INVALID_THIRD_DIGIT_INTS = frozenset({0, 1})
+
+    # Translation table that strips non-digits
+    DIGITS_ONLY = DigitTranslationTable()
 
     @staticmethod
     def clean_phone(phone_raw: str) -> str:
@@ -25,7 +37,7 @@ class PhoneValidator:
         Returns:
             String with only numeric digits
         """
-        return re.sub(r'\D', '', phone_raw)
+        return phone_raw.translate(PhoneValidator.DIGITS_ONLY)
 
     @staticmethod
     def validate_phone(phone_number: str) -> Optional[str]:
@@ -54,18 +66,19 @@ class PhoneValidator:
         # Rule 2: Take last 9 digits
         phone_9digit = cleaned[-9:]
 
-        # Rule 3: Length must be exactly 9
-        if len(phone_9digit) != 9:
+        # Rule 3: Length must be exactly 9 (ASCII digits, so int() can't normalize other scripts)
+        if len(phone_9digit) != 9 or not phone_9digit.isascii():
             return None
 
+        # Split off the prefix and third digit arithmetically instead of slicing
+        prefix, rest = divmod(int(phone_9digit), 10_000_000)
+
         # Rule 4: First 2 digits must be valid prefix
-        prefix = phone_9digit[:2]
-        if prefix not in PhoneValidator.VALID_PREFIXES:
+        if prefix not in PhoneValidator.VALID_PREFIX_INTS:
             return None
 
         # Rule 5: 3rd digit cannot be 0 or 1
-        third_digit = phone_9digit[2]
-        if third_digit in PhoneValidator.INVALID_THIRD_DIGITS:
+        if rest // 1_000_000 in PhoneValidator.INVALID_THIRD_DIGIT_INTS:
             return None
 
         return phone_9digit